@@ -1,6 +1,11 @@
 import unittest
 import time
 import tex2typst
+from tex2typst import _tex2typst_core
+
+# Iterations per timed batch and minimum total timed runtime per benchmark
+BATCH_SIZE = 100
+MIN_TIME_NS = 500_000_000
 
 
 class TestPerformanceFunctionAPI(unittest.TestCase):
@@ -23,21 +28,46 @@ class TestPerformanceFunctionAPI(unittest.TestCase):
 
     def benchmark(self, name, latex_input, iterations=10000):
         # Warmup
-        for _ in range(100):
+        for _ in range(BATCH_SIZE):
             tex2typst.tex2typst(latex_input)
 
-        start_time = time.perf_counter()
+        # Run fixed-size batches until both the iteration count and the
+        # minimum runtime are reached, so the timer resolution stays negligible
+        total_iterations = 0
+        elapsed_ns = 0
+        while total_iterations < iterations or elapsed_ns < MIN_TIME_NS:
+            start_ns = time.perf_counter_ns()
+            for _ in range(BATCH_SIZE):
+                tex2typst.tex2typst(latex_input)
+            elapsed_ns += time.perf_counter_ns() - start_ns
+            total_iterations += BATCH_SIZE
+
+        total_time = elapsed_ns / 1e9
+        avg_latency_ms = elapsed_ns / total_iterations / 1e6
+        throughput_qps = total_iterations / total_time
 
-        for _ in range(iterations):
-            tex2typst.tex2typst(latex_input)
+        print(f"\n--- Benchmark (Function API): {name} ---")
+        print(f"Iterations : {total_iterations}")
+        print(f"Total Time : {total_time:.4f} s")
+        print(f"Latency    : {avg_latency_ms:.4f} ms/op")
+        print(f"Throughput : {throughput_qps:.0f} ops/sec")
+
+        self.assertGreater(throughput_qps, 10, "Throughput is surprisingly low!")
 
-        end_time = time.perf_counter()
+    def benchmark_batch(self, name, latex_input, iterations=10000):
+        # Measure the native batch API directly: one call converts every item,
+        # bypassing the Python-level cache
+        batch = [latex_input] * iterations
 
-        total_time = end_time - start_time
-        avg_latency_ms = (total_time / iterations) * 1000
+        start_ns = time.perf_counter_ns()
+        _tex2typst_core.tex2typst_batch(batch)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+
+        total_time = elapsed_ns / 1e9
+        avg_latency_ms = elapsed_ns / iterations / 1e6
         throughput_qps = iterations / total_time
 
-        print(f"\n--- Benchmark (Function API): {name} ---")
+        print(f"\n--- Benchmark (Batch API): {name} ---")
         print(f"Iterations : {iterations}")
         print(f"Total Time : {total_time:.4f} s")
         print(f"Latency    : {avg_latency_ms:.4f} ms/op")
@@ -57,6 +87,18 @@ class TestPerformanceFunctionAPI(unittest.TestCase):
         latex = r"\\int_{-\\infty}^{\\infty} e^{-x^2} dx = \sqrt{\\pi} \\quad \\text{where } x \\in \\mathbb{R}"
         self.benchmark("Gaussian Integral", latex, iterations=100)
 
+    def test_perf_batch_simple(self):
+        latex = "\\alpha"
+        self.benchmark_batch("Simple Token", latex, iterations=500)
+
+    def test_perf_batch_medium(self):
+        latex = "\\frac{-b \\pm \\sqrt{b^2 - 4ac}}{2a}"
+        self.benchmark_batch("Quadratic Formula", latex, iterations=200)
+
+    def test_perf_batch_complex(self):
+        latex = r"\\int_{-\\infty}^{\\infty} e^{-x^2} dx = \sqrt{\\pi} \\quad \\text{where } x \\in \\mathbb{R}"
+        self.benchmark_batch("Gaussian Integral", latex, iterations=100)
+
 
 if __name__ == "__main__":
     unittest.main(argv=["first-arg-is-ignored"], verbosity=2)
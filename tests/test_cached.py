@@ -1,5 +1,7 @@
 """Test LRU cached versions."""
 
+import sys
+import threading
 import unittest
 import time
 
@@ -59,6 +61,23 @@ class TestCachedAPI(unittest.TestCase):
         self.assertEqual(info["tex2typst"].misses, 2)
         self.assertEqual(info["tex2typst"].currsize, 2)
 
+    def test_cache_info_snapshot(self):
+        """Test that cache_info is live while snapshot() keeps its values"""
+        import tex2typst
+
+        tex2typst.clear_cache()
+
+        tex2typst.tex2typst(r"\alpha")
+        live = tex2typst.cache_info()["tex2typst"]
+        snapshot = live.snapshot()
+        tex2typst.tex2typst(r"\alpha")
+
+        self.assertEqual(live.hits, 1)
+        self.assertEqual(snapshot.hits, 0)
+        self.assertEqual(snapshot.misses, 1)
+        self.assertEqual(snapshot.currsize, 1)
+        self.assertEqual(snapshot.maxsize, live.maxsize)
+
     def test_clear_cache(self):
         """Test cache clearing"""
         import tex2typst
@@ -77,6 +96,104 @@ class TestCachedAPI(unittest.TestCase):
         self.assertEqual(info_after["tex2typst"].currsize, 0)
         self.assertEqual(info_after["typst2tex"].currsize, 0)
 
+    def test_custom_macros_share_cache_entry(self):
+        """Test that equal macro dicts hit the cache regardless of key order"""
+        import tex2typst
+
+        tex2typst.clear_cache()
+
+        latex = r"\myop y=\sgn(x)"
+        macros = {r"\myop": r"\operatorname{myop}", r"\sgn": r"\operatorname{sgn}"}
+        reordered = {r"\sgn": r"\operatorname{sgn}", r"\myop": r"\operatorname{myop}"}
+
+        result1 = tex2typst.tex2typst(latex, custom_tex_macros=macros)
+        result2 = tex2typst.tex2typst(latex, custom_tex_macros=macros)
+        result3 = tex2typst.tex2typst(latex, custom_tex_macros=reordered)
+
+        self.assertEqual(result1, result2)
+        self.assertEqual(result1, result3)
+        info = tex2typst.cache_info()
+        self.assertEqual(info["tex2typst"].hits, 2)
+        self.assertEqual(info["tex2typst"].misses, 1)
+
+    def test_cache_entries_per_option_set(self):
+        """Test that each option set gets its own entry for the same input"""
+        import tex2typst
+
+        tex2typst.clear_cache()
+
+        slash = tex2typst.tex2typst(r"\frac{1}{2}")
+        frac = tex2typst.tex2typst(r"\frac{1}{2}", frac_to_slash=False)
+        self.assertNotEqual(slash, frac)
+        self.assertEqual(tex2typst.tex2typst(r"\frac{1}{2}"), slash)
+
+        info = tex2typst.cache_info()
+        self.assertEqual(info["tex2typst"].hits, 1)
+        self.assertEqual(info["tex2typst"].misses, 2)
+        self.assertEqual(info["tex2typst"].currsize, 2)
+
+    def test_cache_size_is_bounded(self):
+        """Test that the cache is reset once it exceeds its size cap"""
+        import tex2typst
+
+        tex2typst.clear_cache()
+        tex2typst._TEX_STATS.maxsize = 2
+        try:
+            tex2typst.tex2typst(r"\alpha")
+            tex2typst.tex2typst(r"\beta")
+            tex2typst.tex2typst(r"\gamma")  # Exceeds the cap, cache is reset
+
+            info = tex2typst.cache_info()
+            self.assertEqual(info["tex2typst"].currsize, 1)
+        finally:
+            tex2typst._TEX_STATS.maxsize = tex2typst._CACHE_MAXSIZE
+            tex2typst.clear_cache()
+
+    def test_threaded_option_interning(self):
+        """Test that concurrent calls with distinct options never mix them up"""
+        import tex2typst
+
+        tex2typst.clear_cache()
+        failures = []
+        interned = []
+
+        def convert(n):
+            for i in range(50):
+                name = f"m{n}x{i}"
+                macros = {r"\myop": rf"\operatorname{{{name}}}"}
+                result = tex2typst.tex2typst(r"\myop", custom_tex_macros=macros)
+                if result != f'op("{name}")':
+                    failures.append((name, result))
+
+        def intern(n):
+            for i in range(400):
+                macros = ((r"\myop", f"i{n}x{i}"),)
+                entry = tex2typst._tex2typst_options(
+                    None, None, None, None, None, None, macros
+                )
+                interned.append((macros, entry))
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-7)
+        try:
+            threads = [
+                threading.Thread(target=target, args=(n,))
+                for target in (convert, intern)
+                for n in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(failures, [])
+        ids = [opts_id for _, (opts_id, _) in interned]
+        self.assertEqual(len(ids), len(set(ids)))
+        for macros, (_, kwargs) in interned:
+            self.assertEqual(kwargs["custom_tex_macros"], dict(macros))
+
 
 if __name__ == "__main__":
     unittest.main(argv=["first-arg-is-ignored"], verbosity=2)
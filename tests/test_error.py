@@ -10,3 +10,27 @@ class TestTexError(unittest.TestCase):
             )
         except Exception as e:
             self.assertIn("Conversion failed:", str(e))
+
+    def test_error_is_cached(self):
+        tex2typst.clear_cache()
+        latex = r"\frac{1}{2"
+        with self.assertRaises(ValueError) as first:
+            tex2typst.tex2typst(latex)
+        with self.assertRaises(ValueError) as second:
+            tex2typst.tex2typst(latex)
+
+        self.assertIn("Conversion failed:", str(second.exception))
+        self.assertEqual(str(first.exception), str(second.exception))
+        info = tex2typst.cache_info()["tex2typst"]
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_typst_error_is_cached(self):
+        tex2typst.clear_cache()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                tex2typst.typst2tex("frac(1")
+
+        info = tex2typst.cache_info()["typst2tex"]
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
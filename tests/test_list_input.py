@@ -61,7 +61,7 @@ class TestListInput(unittest.TestCase):
         self.assertEqual(results, [])
 
     def test_list_caching(self):
-        """Test that single strings use cache, while lists use batch processing"""
+        """Test that lists share the cache with single string conversions"""
         tex2typst.clear_cache()
 
         # Single string conversions use cache
@@ -72,14 +72,34 @@ class TestListInput(unittest.TestCase):
         info = tex2typst.cache_info()
         self.assertGreater(info["tex2typst"].hits, 0, "Single strings should use cache")
 
-        # List conversions use batch processing (bypasses cache for performance)
+        # Only list items missing from the cache go through the batch API
         tex2typst.clear_cache()
         tex2typst.tex2typst([r"\alpha", r"\beta"])
-        tex2typst.tex2typst([r"\alpha", r"\gamma"])
+        results = tex2typst.tex2typst([r"\alpha", r"\gamma", r"\gamma"])
 
+        self.assertEqual(results, ["alpha", "gamma", "gamma"])
         info = tex2typst.cache_info()
-        # Batch API doesn't go through Python-level cache
-        self.assertEqual(info["tex2typst"].hits, 0, "Lists use batch API, not cache")
+        self.assertEqual(info["tex2typst"].hits, 2)
+        self.assertEqual(info["tex2typst"].misses, 3)
+        self.assertEqual(info["tex2typst"].currsize, 3)
+
+        # Batch results are visible to single string conversions
+        tex2typst.tex2typst(r"\beta")
+        self.assertEqual(tex2typst.cache_info()["tex2typst"].hits, 3)
+
+    def test_many_entry_points(self):
+        """Test the list-only entry points"""
+        self.assertEqual(
+            tex2typst.tex2typst_many([r"\alpha", r"\beta"]), ["alpha", "beta"]
+        )
+        self.assertEqual(
+            tex2typst.typst2tex_many(["alpha", "beta"]), [r"\alpha", r"\beta"]
+        )
+        # A string is not split into characters
+        with self.assertRaises(TypeError):
+            tex2typst.tex2typst_many("ab")  # type: ignore
+        with self.assertRaises(TypeError):
+            tex2typst.typst2tex_many("ab")  # type: ignore
 
     def test_invalid_type(self):
         """Test that invalid types raise TypeError"""
@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 import unittest
 import tex2typst
 
@@ -36,6 +39,15 @@ class TestTex2TypstFunctionAPI(unittest.TestCase):
         except Exception as e:
             self.fail(f"Converter crashed on invalid input: {e}")
 
+    def test_tex2typst_one(self):
+        self.assertEqual(tex2typst.tex2typst_one("\\alpha"), "alpha")
+        self.assertEqual(
+            tex2typst.tex2typst_one("\\frac{1}{2}", frac_to_slash=False),
+            tex2typst.tex2typst("\\frac{1}{2}", frac_to_slash=False),
+        )
+        with self.assertRaises(TypeError):
+            tex2typst.tex2typst_one(None)  # type: ignore
+
     def test_singleton_reuse(self):
         """Verify that multiple calls use the same singleton instance"""
         result1 = tex2typst.tex2typst("\\alpha")
@@ -64,6 +76,15 @@ class TestTypst2TexFunctionAPI(unittest.TestCase):
         result = tex2typst.typst2tex("")
         self.assertEqual(result.strip(), "")
 
+    def test_typst2tex_one(self):
+        self.assertEqual(tex2typst.typst2tex_one("alpha"), "\\alpha")
+        self.assertEqual(
+            tex2typst.typst2tex_one("x", block_math_mode=False),
+            tex2typst.typst2tex("x", block_math_mode=False),
+        )
+        with self.assertRaises(TypeError):
+            tex2typst.typst2tex_one(None)  # type: ignore
+
     def test_roundtrip(self):
         """Test converting from LaTeX to Typst and back"""
         latex = "\\alpha + \\beta"
@@ -116,6 +137,36 @@ class TestTex2TypstOptions(unittest.TestCase):
         print(f"\n[Test Options custom_tex_macros] Input: {latex} -> Output: {result}")
         self.assertIn('op("myop")', result)
 
+    def test_prepared_custom_tex_macros(self):
+        latex = "\\myop y=\\sgn(x)"
+        macros = {
+            "\\myop": "\\operatorname{myop}",
+            "\\sgn": "\\operatorname{sgn}",
+        }
+        prepared = tex2typst.prepare_macros(macros)
+        result = tex2typst.tex2typst(latex, custom_tex_macros=prepared)
+        print(f"\n[Test Options prepare_macros] Input: {latex} -> Output: {result}")
+        self.assertEqual(result, tex2typst.tex2typst(latex, custom_tex_macros=macros))
+        self.assertEqual(
+            tex2typst.tex2typst([latex], custom_tex_macros=prepared), [result]
+        )
+
+    def test_non_bool_option_rejected(self):
+        # The bools are interned first, so 1 and 0 would match their entries
+        tex2typst.tex2typst("x", non_strict=True)
+        tex2typst.tex2typst("x", non_strict=False)
+        for value in (1, 0, 1.0, "yes"):
+            with self.assertRaises(TypeError):
+                tex2typst.tex2typst("x", non_strict=value)
+            with self.assertRaises(TypeError):
+                tex2typst.tex2typst(["x"], non_strict=value)
+
+    def test_empty_input_still_checks_options(self):
+        with self.assertRaises(TypeError):
+            tex2typst.tex2typst("", non_strict="x")
+        with self.assertRaises(TypeError):
+            tex2typst.tex2typst([], non_strict="x")
+
     def test_multiple_options(self):
         latex = "\\frac{1}{\\infty}"
         result = tex2typst.tex2typst(latex, frac_to_slash=False, infty_to_oo=True)
@@ -143,6 +194,41 @@ class TestTypst2TexOptions(unittest.TestCase):
         )
         self.assertIsInstance(result, str)
 
+    def test_non_bool_block_math_mode_rejected(self):
+        for typst in ("x", ""):
+            with self.assertRaises(TypeError):
+                tex2typst.typst2tex(typst, block_math_mode="x")
+        with self.assertRaises(TypeError):
+            tex2typst.typst2tex([], block_math_mode="x")
+        # 1 must not hit the cache entry for True
+        tex2typst.typst2tex("x", block_math_mode=True)
+        with self.assertRaises(TypeError):
+            tex2typst.typst2tex("x", block_math_mode=1)
+
+
+class TestLazyCoreImport(unittest.TestCase):
+    """Test that the native extension is only loaded on first use"""
+
+    def test_import_leaves_core_unloaded(self):
+        # A fresh interpreter, since other tests import the core eagerly
+        code = (
+            "import sys, tex2typst\n"
+            "assert 'tex2typst._tex2typst_core' not in sys.modules\n"
+            "tex2typst.cache_info(); tex2typst.clear_cache()\n"
+            "assert 'tex2typst._tex2typst_core' not in sys.modules\n"
+            "assert tex2typst.tex2typst(r'\\alpha') == 'alpha'\n"
+            "assert 'tex2typst._tex2typst_core' in sys.modules\n"
+        )
+        env = dict(os.environ)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(tex2typst.__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (root, env.get("PYTHONPATH")) if p
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
 
 if __name__ == "__main__":
     unittest.main()
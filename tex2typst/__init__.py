@@ -1,7 +1,7 @@
 """
 tex2typst: Convert between LaTeX/TeX and Typst math notation.
 
-This module provides conversion functions with built-in LRU caching for improved
+This module provides conversion functions with built-in caching for improved
 performance on repeated conversions.
 
 Usage:
@@ -12,45 +12,365 @@ Usage:
     >>> tex2typst.clear_cache()  # Clear cache
 """
 
-from functools import lru_cache
-from typing import Optional, Dict, Union, List, overload
-from . import _tex2typst_core
+import itertools
+import threading
+from functools import partial
+from types import ModuleType
+from typing import Callable, Optional, Dict, Union, List, Tuple
 
-__version__ = _tex2typst_core.__version__
+# The native extension is imported on first use rather than at import time
+_core_module: Optional[ModuleType] = None
 
 
-def _make_hashable(d: Optional[Dict[str, str]]) -> Optional[tuple]:
+def _core() -> ModuleType:
+    """Return the native extension module, importing it on first use."""
+    global _core_module, _core_tex2typst, _core_typst2tex
+    global _core_tex2typst_batch, _core_typst2tex_batch
+    if _core_module is None:
+        from . import _tex2typst_core
+
+        _core_module = _tex2typst_core
+        # Rebind the entry points to the native functions so later calls skip
+        # both the loader and the attribute lookup on the extension module
+        _core_tex2typst = _tex2typst_core.tex2typst
+        _core_typst2tex = _tex2typst_core.typst2tex
+        _core_tex2typst_batch = _tex2typst_core.tex2typst_batch
+        _core_typst2tex_batch = _tex2typst_core.typst2tex_batch
+    return _core_module
+
+
+def _lazy_core_function(name: str) -> Callable[..., object]:
+    """Create a placeholder that loads the core, then calls its function."""
+
+    def load_and_call(*args: object, **kwargs: object) -> object:
+        return getattr(_core(), name)(*args, **kwargs)
+
+    return load_and_call
+
+
+_core_tex2typst = _lazy_core_function("tex2typst")
+_core_typst2tex = _lazy_core_function("typst2tex")
+_core_tex2typst_batch = _lazy_core_function("tex2typst_batch")
+_core_typst2tex_batch = _lazy_core_function("typst2tex_batch")
+
+
+def __getattr__(name: str) -> object:
+    if name == "__version__":
+        return _core().__version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Upper bound on cached entries per direction; the cache is dropped wholesale
+# once exceeded, which keeps hits free of any LRU bookkeeping.
+_CACHE_MAXSIZE = 4096
+
+# Plain dicts rather than functools caches: a hit is two dict.get calls with no
+# wrapper frame, key tuple packing or lock acquisition. The outer level is keyed
+# on the input string and the inner one on the options, so converting the same
+# input with different options hashes the (possibly long) string only once.
+_TEX_CACHE: Dict[str, Dict[int, str]] = {}
+_TYPST_CACHE: Dict[str, Dict[Optional[bool], str]] = {}
+
+# Messages of failed conversions, consulted only after a cache miss so that
+# repeating an invalid input raises again without another trip into Rust.
+# Such a replay is answered from the cache, so it counts as a hit.
+_TEX_ERRORS: Dict[Tuple[str, int], str] = {}
+_TYPST_ERRORS: Dict[Tuple[str, Optional[bool]], str] = {}
+
+
+class _CacheStats:
+    """
+    Cache statistics, updated in place and returned as-is by cache_info().
+
+    currsize counts (input, options) entries across both cache levels.
+    """
+
+    __slots__ = ("hits", "misses", "maxsize", "currsize")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = _CACHE_MAXSIZE
+        self.currsize = 0
+
+    def snapshot(self) -> "_CacheStats":
+        """Return a copy that no longer follows later conversions."""
+        copy = _CacheStats()
+        copy.hits = self.hits
+        copy.misses = self.misses
+        copy.maxsize = self.maxsize
+        copy.currsize = self.currsize
+        return copy
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"maxsize={self.maxsize}, currsize={self.currsize})"
+        )
+
+
+_TEX_STATS = _CacheStats()
+_TYPST_STATS = _CacheStats()
+
+
+# Canonical form of custom_tex_macros, as returned by prepare_macros()
+PreparedMacros = Tuple[Tuple[str, str], ...]
+
+
+def prepare_macros(macros: Dict[str, str]) -> PreparedMacros:
+    """
+    Convert custom TeX macros to the canonical form used for caching.
+
+    Passing the result as ``custom_tex_macros`` skips converting the dict on
+    every call, which helps when the same macros are used in a tight loop.
+
+    Args:
+        macros: Custom TeX macro definitions
+
+    Returns:
+        Sorted tuple of (macro, expansion) pairs
+
+    Example:
+        >>> macros = prepare_macros({"\\myop": "\\operatorname{myop}"})
+        >>> tex2typst(r"\\myop x", custom_tex_macros=macros)
+        'op("myop") x'
+    """
+    return tuple(sorted(macros.items()))
+
+
+def _make_hashable(
+    d: Optional[Union[Dict[str, str], PreparedMacros]],
+) -> Optional[tuple]:
     """Convert dict to hashable tuple for caching."""
-    return tuple(sorted(d.items())) if d is not None else None
+    if not d:
+        # None and empty macros are equivalent, so they share a cache slot
+        return None
+    if type(d) is tuple:
+        # Already prepared by prepare_macros()
+        return d
+    return tuple(sorted(d.items()))
+
+
+def _option_type_error(name: str, value: object) -> TypeError:
+    """Build the error for an option that is neither None nor a bool."""
+    return TypeError(
+        f"argument '{name}': '{type(value).__name__}' object cannot be cast as 'bool'"
+    )
 
 
-@lru_cache(maxsize=1024)
-def _tex2typst_cached(
-    tex: str,
+# Option tuples are interned to small integer ids so cache keys stay (str, int)
+# instead of hashing every option on each call. Each entry also carries the
+# keyword arguments for the native converter.
+_OPTIONS_INTERN: Dict[tuple, Tuple[int, Dict[str, object]]] = {}
+_OPTIONS_LOCK = threading.Lock()
+# Ids are never reused, even after the table is cleared, so a result converted
+# with a stale id can never be cached under another option set
+_OPTIONS_IDS = itertools.count()
+
+
+# Calls without any options skip validation and interning entirely. The entry
+# is also kept in the intern table so every path agrees on its id.
+_DEFAULT_OPTIONS_KEY = (None, None, None, None, None, None, None)
+_DEFAULT_OPTIONS: Tuple[int, Dict[str, object]] = (
+    next(_OPTIONS_IDS),
+    {
+        "non_strict": None,
+        "prefer_shorthands": None,
+        "keep_spaces": None,
+        "frac_to_slash": None,
+        "infty_to_oo": None,
+        "optimize": None,
+        "custom_tex_macros": None,
+    },
+)
+_OPTIONS_INTERN[_DEFAULT_OPTIONS_KEY] = _DEFAULT_OPTIONS
+
+# The most recent non-default options and their entry. Entry points match it
+# by identity, which also proves the values were validated, so repeating the
+# same options skips _tex2typst_options() entirely. Replaced as one tuple so
+# threads never see a mix of two option sets.
+_LAST_OPTIONS: tuple = _DEFAULT_OPTIONS_KEY + (_DEFAULT_OPTIONS,)
+
+
+def _tex2typst_options(
     non_strict: Optional[bool],
     prefer_shorthands: Optional[bool],
     keep_spaces: Optional[bool],
     frac_to_slash: Optional[bool],
     infty_to_oo: Optional[bool],
     optimize: Optional[bool],
-    custom_tex_macros: Optional[tuple],
-) -> str:
-    """Internal cached function with hashable parameters."""
-    macros = dict(custom_tex_macros) if custom_tex_macros else None
-    return _tex2typst_core.tex2typst(
+    custom_tex_macros: Optional[Union[Dict[str, str], PreparedMacros]],
+) -> Tuple[int, Dict[str, object]]:
+    """
+    Validate and canonicalize tex2typst options, returning their interned id
+    and the keyword arguments for the native converter.
+    """
+    global _LAST_OPTIONS
+    # Identity checks keep 0, 1, 0.0 and 1.0 (which hash like the bools) out
+    # of the intern table; the loop below only finds which one to report
+    if not (
+        (non_strict is None or non_strict is True or non_strict is False)
+        and (
+            prefer_shorthands is None
+            or prefer_shorthands is True
+            or prefer_shorthands is False
+        )
+        and (keep_spaces is None or keep_spaces is True or keep_spaces is False)
+        and (frac_to_slash is None or frac_to_slash is True or frac_to_slash is False)
+        and (infty_to_oo is None or infty_to_oo is True or infty_to_oo is False)
+        and (optimize is None or optimize is True or optimize is False)
+    ):
+        for name, value in (
+            ("non_strict", non_strict),
+            ("prefer_shorthands", prefer_shorthands),
+            ("keep_spaces", keep_spaces),
+            ("frac_to_slash", frac_to_slash),
+            ("infty_to_oo", infty_to_oo),
+            ("optimize", optimize),
+        ):
+            if value is not None and type(value) is not bool:
+                raise _option_type_error(name, value)
+    opts = (
+        non_strict,
+        prefer_shorthands,
+        keep_spaces,
+        frac_to_slash,
+        infty_to_oo,
+        optimize,
+        _make_hashable(custom_tex_macros) if custom_tex_macros else None,
+    )
+    entry = _OPTIONS_INTERN.get(opts)
+    if entry is None:
+        with _OPTIONS_LOCK:
+            # Another thread may have interned the same options meanwhile
+            entry = _OPTIONS_INTERN.get(opts)
+            if entry is None:
+                if len(_OPTIONS_INTERN) >= _CACHE_MAXSIZE:
+                    _OPTIONS_INTERN.clear()
+                    _OPTIONS_INTERN[_DEFAULT_OPTIONS_KEY] = _DEFAULT_OPTIONS
+                kwargs: Dict[str, object] = {
+                    "non_strict": non_strict,
+                    "prefer_shorthands": prefer_shorthands,
+                    "keep_spaces": keep_spaces,
+                    "frac_to_slash": frac_to_slash,
+                    "infty_to_oo": infty_to_oo,
+                    "optimize": optimize,
+                    "custom_tex_macros": dict(opts[-1]) if opts[-1] else None,
+                }
+                entry = _OPTIONS_INTERN[opts] = (next(_OPTIONS_IDS), kwargs)
+    # Dicts can be mutated between calls, so only immutable macros qualify
+    if custom_tex_macros is None or type(custom_tex_macros) is tuple:
+        _LAST_OPTIONS = (
+            non_strict,
+            prefer_shorthands,
+            keep_spaces,
+            frac_to_slash,
+            infty_to_oo,
+            optimize,
+            custom_tex_macros,
+            entry,
+        )
+    return entry
+
+
+def _cache_put(
+    cache: Dict[str, Dict],
+    stats: _CacheStats,
+    text: str,
+    opts_key: object,
+    value: str,
+) -> None:
+    """Store a result, dropping the whole cache first if it is full."""
+    if stats.currsize >= stats.maxsize:
+        cache.clear()
+        stats.currsize = 0
+    inner = cache.get(text)
+    if inner is None:
+        inner = cache[text] = {}
+    inner[opts_key] = value
+    stats.currsize += 1
+
+
+def _error_put(errors: Dict[tuple, str], key: tuple, message: str) -> None:
+    """Remember a failed conversion, dropping all entries first if full."""
+    if len(errors) >= _CACHE_MAXSIZE:
+        errors.clear()
+    errors[key] = message
+
+
+def _convert_many(
+    items: List[str],
+    cache: Dict[str, Dict],
+    stats: _CacheStats,
+    opts_key: object,
+    convert_batch: Callable[[List[str]], List[str]],
+) -> List[str]:
+    """
+    Convert a list of strings through the cache.
+
+    Cached items are filled in directly; the remaining distinct items are
+    converted with a single batch call and added to the cache.
+    """
+    results: List[Optional[str]] = [None] * len(items)
+    misses: Dict[str, List[int]] = {}
+    for i, item in enumerate(items):
+        inner = cache.get(item)
+        result = inner.get(opts_key) if inner is not None else None
+        if result is None:
+            misses.setdefault(item, []).append(i)
+        else:
+            results[i] = result
+    # Repeats of an item converted in this call count as hits
+    stats.hits += len(items) - len(misses)
+    stats.misses += len(misses)
+    if misses:
+        for item, result in zip(misses, convert_batch(list(misses))):
+            _cache_put(cache, stats, item, opts_key, result)
+            for i in misses[item]:
+                results[i] = result
+    return results  # type: ignore[return-value]
+
+
+def _tex2typst_convert(tex: str, opts_id: int, kwargs: Dict[str, object]) -> str:
+    """Convert a string that missed the cache and store the result."""
+    if type(tex) is not str and not isinstance(tex, str):
+        raise TypeError(f"Expected str, got {type(tex).__name__}")
+    # Empty input converts to empty output, no need to touch the cache
+    if tex == "":
+        return ""
+    key = (tex, opts_id)
+    error = _TEX_ERRORS.get(key)
+    if error is not None:
+        _TEX_STATS.hits += 1
+        raise ValueError(error)
+    _TEX_STATS.misses += 1
+    try:
+        result = _core_tex2typst(tex, **kwargs)
+    except ValueError as e:
+        _error_put(_TEX_ERRORS, key, str(e))
+        raise
+    _cache_put(_TEX_CACHE, _TEX_STATS, tex, opts_id, result)
+    return result
+
+
+def _tex2typst_convert_many(
+    tex: List[str], opts_id: int, kwargs: Dict[str, object]
+) -> List[str]:
+    """Convert a list of strings with already resolved options."""
+    if type(tex) is not list and not isinstance(tex, list):
+        raise TypeError(f"Expected list, got {type(tex).__name__}")
+    if not tex:
+        return []
+    return _convert_many(
         tex,
-        non_strict=non_strict,
-        prefer_shorthands=prefer_shorthands,
-        keep_spaces=keep_spaces,
-        frac_to_slash=frac_to_slash,
-        infty_to_oo=infty_to_oo,
-        optimize=optimize,
-        custom_tex_macros=macros,
+        _TEX_CACHE,
+        _TEX_STATS,
+        opts_id,
+        partial(_core_tex2typst_batch, **kwargs),
     )
 
 
-@overload
-def tex2typst(
+def tex2typst_one(
     tex: str,
     *,
     non_strict: Optional[bool] = None,
@@ -59,12 +379,75 @@ def tex2typst(
     frac_to_slash: Optional[bool] = None,
     infty_to_oo: Optional[bool] = None,
     optimize: Optional[bool] = None,
-    custom_tex_macros: Optional[Dict[str, str]] = None,
-) -> str: ...
+    custom_tex_macros: Optional[Union[Dict[str, str], PreparedMacros]] = None,
+) -> str:
+    """
+    Convert a single LaTeX/TeX string to Typst format (with caching).
 
+    Same as tex2typst() with a string, without the input type dispatch.
 
-@overload
-def tex2typst(
+    Args:
+        tex: LaTeX/TeX math string to convert
+        non_strict: Allow non-strict parsing
+        prefer_shorthands: Prefer shorthand notation
+        keep_spaces: Preserve spaces in output
+        frac_to_slash: Convert fractions to slash notation
+        infty_to_oo: Convert infinity symbol to oo
+        optimize: Optimize output
+        custom_tex_macros: Custom TeX macro definitions, either as a dict or
+            as returned by prepare_macros()
+
+    Returns:
+        Converted Typst string
+
+    Example:
+        >>> tex2typst_one(r"\\frac{1}{2}")
+        '1/2'
+    """
+    # Defaults skip the _tex2typst_options() call; the hit path is repeated in
+    # tex2typst() so neither entry point pays for an extra frame on a hit
+    if (
+        non_strict is None
+        and prefer_shorthands is None
+        and keep_spaces is None
+        and frac_to_slash is None
+        and infty_to_oo is None
+        and optimize is None
+        and not custom_tex_macros
+    ):
+        opts_id, kwargs = _DEFAULT_OPTIONS
+    else:
+        last = _LAST_OPTIONS
+        if (
+            non_strict is last[0]
+            and prefer_shorthands is last[1]
+            and keep_spaces is last[2]
+            and frac_to_slash is last[3]
+            and infty_to_oo is last[4]
+            and optimize is last[5]
+            and custom_tex_macros is last[6]
+        ):
+            opts_id, kwargs = last[7]
+        else:
+            opts_id, kwargs = _tex2typst_options(
+                non_strict,
+                prefer_shorthands,
+                keep_spaces,
+                frac_to_slash,
+                infty_to_oo,
+                optimize,
+                custom_tex_macros,
+            )
+    inner = _TEX_CACHE.get(tex)
+    if inner is not None:
+        result = inner.get(opts_id)
+        if result is not None:
+            _TEX_STATS.hits += 1
+            return result
+    return _tex2typst_convert(tex, opts_id, kwargs)
+
+
+def tex2typst_many(
     tex: List[str],
     *,
     non_strict: Optional[bool] = None,
@@ -73,8 +456,43 @@ def tex2typst(
     frac_to_slash: Optional[bool] = None,
     infty_to_oo: Optional[bool] = None,
     optimize: Optional[bool] = None,
-    custom_tex_macros: Optional[Dict[str, str]] = None,
-) -> List[str]: ...
+    custom_tex_macros: Optional[Union[Dict[str, str], PreparedMacros]] = None,
+) -> List[str]:
+    """
+    Convert a list of LaTeX/TeX strings to Typst format (with caching).
+
+    Same as tex2typst() with a list, without the input type dispatch. Cached
+    items are served directly; the rest go through the batch API, which
+    processes them in one Rust/JS context entry.
+
+    Args:
+        tex: List of LaTeX/TeX math strings to convert
+        non_strict: Allow non-strict parsing
+        prefer_shorthands: Prefer shorthand notation
+        keep_spaces: Preserve spaces in output
+        frac_to_slash: Convert fractions to slash notation
+        infty_to_oo: Convert infinity symbol to oo
+        optimize: Optimize output
+        custom_tex_macros: Custom TeX macro definitions, either as a dict or
+            as returned by prepare_macros()
+
+    Returns:
+        List of converted Typst strings
+
+    Example:
+        >>> tex2typst_many([r"\\alpha", r"\\beta"])
+        ['alpha', 'beta']
+    """
+    opts_id, kwargs = _tex2typst_options(
+        non_strict,
+        prefer_shorthands,
+        keep_spaces,
+        frac_to_slash,
+        infty_to_oo,
+        optimize,
+        custom_tex_macros,
+    )
+    return _tex2typst_convert_many(tex, opts_id, kwargs)
 
 
 def tex2typst(
@@ -86,13 +504,15 @@ def tex2typst(
     frac_to_slash: Optional[bool] = None,
     infty_to_oo: Optional[bool] = None,
     optimize: Optional[bool] = None,
-    custom_tex_macros: Optional[Dict[str, str]] = None,
+    custom_tex_macros: Optional[Union[Dict[str, str], PreparedMacros]] = None,
 ) -> Union[str, List[str]]:
     """
-    Convert LaTeX/TeX to Typst format (with LRU caching).
+    Convert LaTeX/TeX to Typst format (with caching).
 
     Intelligently handles both single strings and lists of strings.
     Results are cached automatically for improved performance on repeated conversions.
+    Callers that know their input type can use tex2typst_one() or
+    tex2typst_many() directly.
 
     Args:
         tex: LaTeX/TeX math string or list of strings to convert
@@ -102,7 +522,8 @@ def tex2typst(
         frac_to_slash: Convert fractions to slash notation
         infty_to_oo: Convert infinity symbol to oo
         optimize: Optimize output
-        custom_tex_macros: Custom TeX macro definitions
+        custom_tex_macros: Custom TeX macro definitions, either as a dict or
+            as returned by prepare_macros()
 
     Returns:
         Converted Typst string or list of strings (matches input type)
@@ -113,59 +534,148 @@ def tex2typst(
         >>> tex2typst([r"\\alpha", r"\\beta"])
         ['alpha', 'beta']
     """
-    if isinstance(tex, str):
-        # Single string: use cached function
-        macros_tuple = _make_hashable(custom_tex_macros)
-        return _tex2typst_cached(
-            tex,
-            non_strict,
-            prefer_shorthands,
-            keep_spaces,
-            frac_to_slash,
-            infty_to_oo,
-            optimize,
-            macros_tuple,
-        )
-    elif isinstance(tex, list):
-        # List: use batch processing API for better performance
-        # Batch API processes all items in one Rust/JS context entry, reducing overhead
-        return _tex2typst_core.tex2typst_batch(
-            tex,
-            non_strict=non_strict,
-            prefer_shorthands=prefer_shorthands,
-            keep_spaces=keep_spaces,
-            frac_to_slash=frac_to_slash,
-            infty_to_oo=infty_to_oo,
-            optimize=optimize,
-            custom_tex_macros=custom_tex_macros,
-        )
+    # Same hit path as tex2typst_one(), inlined rather than forwarded
+    if (
+        non_strict is None
+        and prefer_shorthands is None
+        and keep_spaces is None
+        and frac_to_slash is None
+        and infty_to_oo is None
+        and optimize is None
+        and not custom_tex_macros
+    ):
+        opts_id, kwargs = _DEFAULT_OPTIONS
+    else:
+        last = _LAST_OPTIONS
+        if (
+            non_strict is last[0]
+            and prefer_shorthands is last[1]
+            and keep_spaces is last[2]
+            and frac_to_slash is last[3]
+            and infty_to_oo is last[4]
+            and optimize is last[5]
+            and custom_tex_macros is last[6]
+        ):
+            opts_id, kwargs = last[7]
+        else:
+            opts_id, kwargs = _tex2typst_options(
+                non_strict,
+                prefer_shorthands,
+                keep_spaces,
+                frac_to_slash,
+                infty_to_oo,
+                optimize,
+                custom_tex_macros,
+            )
+    # Exact type checks short-circuit the common case; subclasses still fall
+    # through to isinstance
+    if type(tex) is str or isinstance(tex, str):
+        inner = _TEX_CACHE.get(tex)
+        if inner is not None:
+            result = inner.get(opts_id)
+            if result is not None:
+                _TEX_STATS.hits += 1
+                return result
+        return _tex2typst_convert(tex, opts_id, kwargs)
+    elif type(tex) is list or isinstance(tex, list):
+        return _tex2typst_convert_many(tex, opts_id, kwargs)
     else:
         raise TypeError(f"Expected str or list, got {type(tex).__name__}")
 
 
-@lru_cache(maxsize=1024)
-def _typst2tex_cached(
-    typst: str,
-    block_math_mode: Optional[bool],
-) -> str:
-    """Internal cached function."""
-    return _tex2typst_core.typst2tex(typst, block_math_mode=block_math_mode)
+def _typst2tex_convert(typst: str, block_math_mode: Optional[bool]) -> str:
+    """Convert a string that missed the cache and store the result."""
+    if type(typst) is not str and not isinstance(typst, str):
+        raise TypeError(f"Expected str, got {type(typst).__name__}")
+    if typst == "":
+        return ""
+    key = (typst, block_math_mode)
+    error = _TYPST_ERRORS.get(key)
+    if error is not None:
+        _TYPST_STATS.hits += 1
+        raise ValueError(error)
+    _TYPST_STATS.misses += 1
+    try:
+        result = _core_typst2tex(typst, block_math_mode=block_math_mode)
+    except ValueError as e:
+        _error_put(_TYPST_ERRORS, key, str(e))
+        raise
+    _cache_put(_TYPST_CACHE, _TYPST_STATS, typst, block_math_mode, result)
+    return result
+
+
+def _typst2tex_convert_many(
+    typst: List[str], block_math_mode: Optional[bool]
+) -> List[str]:
+    """Convert a list of strings with an already validated block_math_mode."""
+    if type(typst) is not list and not isinstance(typst, list):
+        raise TypeError(f"Expected list, got {type(typst).__name__}")
+    if not typst:
+        return []
+    return _convert_many(
+        typst,
+        _TYPST_CACHE,
+        _TYPST_STATS,
+        block_math_mode,
+        partial(_core_typst2tex_batch, block_math_mode=block_math_mode),
+    )
 
 
-@overload
-def typst2tex(
-    typst: str,
-    *,
-    block_math_mode: Optional[bool] = None,
-) -> str: ...
+def typst2tex_one(typst: str, *, block_math_mode: Optional[bool] = None) -> str:
+    """
+    Convert a single Typst string to LaTeX/TeX format (with caching).
 
+    Same as typst2tex() with a string, without the input type dispatch.
 
-@overload
-def typst2tex(
+    Args:
+        typst: Typst math string to convert
+        block_math_mode: Use block math mode
+
+    Returns:
+        Converted LaTeX/TeX string
+
+    Example:
+        >>> typst2tex_one("1/2")
+        '\\\\frac{1}{2}'
+    """
+    # Checked explicitly: the bools key the cache directly, and 0, 1, 0.0 and
+    # 1.0 would hit their entries
+    if block_math_mode is not None and type(block_math_mode) is not bool:
+        raise _option_type_error("block_math_mode", block_math_mode)
+    inner = _TYPST_CACHE.get(typst)
+    if inner is not None:
+        result = inner.get(block_math_mode)
+        if result is not None:
+            _TYPST_STATS.hits += 1
+            return result
+    return _typst2tex_convert(typst, block_math_mode)
+
+
+def typst2tex_many(
     typst: List[str],
     *,
     block_math_mode: Optional[bool] = None,
-) -> List[str]: ...
+) -> List[str]:
+    """
+    Convert a list of Typst strings to LaTeX/TeX format (with caching).
+
+    Same as typst2tex() with a list, without the input type dispatch. Cached
+    items are served directly and the rest are batch-converted.
+
+    Args:
+        typst: List of Typst math strings to convert
+        block_math_mode: Use block math mode
+
+    Returns:
+        List of converted LaTeX/TeX strings
+
+    Example:
+        >>> typst2tex_many(["alpha", "beta"])
+        ['\\\\alpha', '\\\\beta']
+    """
+    if block_math_mode is not None and type(block_math_mode) is not bool:
+        raise _option_type_error("block_math_mode", block_math_mode)
+    return _typst2tex_convert_many(typst, block_math_mode)
 
 
 def typst2tex(
@@ -174,10 +684,12 @@ def typst2tex(
     block_math_mode: Optional[bool] = None,
 ) -> Union[str, List[str]]:
     """
-    Convert Typst to LaTeX/TeX format (with LRU caching).
+    Convert Typst to LaTeX/TeX format (with caching).
 
     Intelligently handles both single strings and lists of strings.
     Results are cached automatically for improved performance on repeated conversions.
+    Callers that know their input type can use typst2tex_one() or
+    typst2tex_many() directly.
 
     Args:
         typst: Typst math string or list of strings to convert
@@ -192,14 +704,19 @@ def typst2tex(
         >>> typst2tex(["alpha", "beta"])
         ['\\\\alpha', '\\\\beta']
     """
-    if isinstance(typst, str):
-        return _typst2tex_cached(typst, block_math_mode)
-    elif isinstance(typst, list):
-        # List: use batch processing API internally for better performance
-        return _tex2typst_core.typst2tex_batch(
-            typst,
-            block_math_mode=block_math_mode,
-        )
+    # Same hit path as typst2tex_one(), inlined rather than forwarded
+    if block_math_mode is not None and type(block_math_mode) is not bool:
+        raise _option_type_error("block_math_mode", block_math_mode)
+    if type(typst) is str or isinstance(typst, str):
+        inner = _TYPST_CACHE.get(typst)
+        if inner is not None:
+            result = inner.get(block_math_mode)
+            if result is not None:
+                _TYPST_STATS.hits += 1
+                return result
+        return _typst2tex_convert(typst, block_math_mode)
+    elif type(typst) is list or isinstance(typst, list):
+        return _typst2tex_convert_many(typst, block_math_mode)
     else:
         raise TypeError(f"Expected str or list, got {type(typst).__name__}")
 
@@ -211,8 +728,14 @@ def clear_cache() -> None:
     Example:
         >>> clear_cache()
     """
-    _tex2typst_cached.cache_clear()
-    _typst2tex_cached.cache_clear()
+    _TEX_CACHE.clear()
+    _TYPST_CACHE.clear()
+    _TEX_ERRORS.clear()
+    _TYPST_ERRORS.clear()
+    for stats in (_TEX_STATS, _TYPST_STATS):
+        stats.hits = 0
+        stats.misses = 0
+        stats.currsize = 0
 
 
 def cache_info() -> Dict[str, object]:
@@ -220,7 +743,9 @@ def cache_info() -> Dict[str, object]:
     Get cache statistics.
 
     Returns:
-        Dictionary with cache info for tex2typst and typst2tex
+        Dictionary with cache info for tex2typst and typst2tex. The statistics
+        objects are shared and keep updating with later conversions; call
+        their snapshot() method to keep the current values.
 
     Example:
         >>> info = cache_info()
@@ -228,15 +753,17 @@ def cache_info() -> Dict[str, object]:
         >>> print(f"tex2typst misses: {info['tex2typst'].misses}")
         >>> print(f"Cache size: {info['tex2typst'].currsize}/{info['tex2typst'].maxsize}")
     """
-    return {
-        "tex2typst": _tex2typst_cached.cache_info(),
-        "typst2tex": _typst2tex_cached.cache_info(),
-    }
+    return {"tex2typst": _TEX_STATS, "typst2tex": _TYPST_STATS}
 
 
 __all__ = [
     "tex2typst",
+    "tex2typst_one",
+    "tex2typst_many",
     "typst2tex",
+    "typst2tex_one",
+    "typst2tex_many",
+    "prepare_macros",
     "clear_cache",
     "cache_info",
     "__version__",
@@ -4,7 +4,20 @@ from typing import overload
 
 __version__: str
 
-__all__ = ["tex2typst", "typst2tex", "clear_cache", "cache_info", "__version__"]
+__all__ = [
+    "tex2typst",
+    "tex2typst_one",
+    "tex2typst_many",
+    "typst2tex",
+    "typst2tex_one",
+    "typst2tex_many",
+    "prepare_macros",
+    "clear_cache",
+    "cache_info",
+    "__version__",
+]
+
+PreparedMacros = tuple[tuple[str, str], ...]
 
 @overload
 def tex2typst(
@@ -16,7 +29,7 @@ def tex2typst(
     frac_to_slash: bool | None = None,
     infty_to_oo: bool | None = None,
     optimize: bool | None = None,
-    custom_tex_macros: dict[str, str] | None = None,
+    custom_tex_macros: dict[str, str] | PreparedMacros | None = None,
 ) -> str:
     """
     Convert LaTeX/TeX math to Typst format.
@@ -32,7 +45,8 @@ def tex2typst(
         frac_to_slash: Convert fractions to slash notation (default: library default)
         infty_to_oo: Convert infinity symbol to oo (default: library default)
         optimize: Optimize output (default: library default)
-        custom_tex_macros: Custom TeX macro definitions as dict mapping macro names to expansions
+        custom_tex_macros: Custom TeX macro definitions as dict mapping macro names to expansions,
+            or as returned by prepare_macros()
 
     Returns:
         Converted Typst string
@@ -62,11 +76,39 @@ def tex2typst(
     frac_to_slash: bool | None = None,
     infty_to_oo: bool | None = None,
     optimize: bool | None = None,
-    custom_tex_macros: dict[str, str] | None = None,
+    custom_tex_macros: dict[str, str] | PreparedMacros | None = None,
 ) -> list[str]:
     """Convert multiple LaTeX/TeX strings to Typst format (with caching)."""
     ...
 
+def tex2typst_one(
+    tex: str,
+    *,
+    non_strict: bool | None = None,
+    prefer_shorthands: bool | None = None,
+    keep_spaces: bool | None = None,
+    frac_to_slash: bool | None = None,
+    infty_to_oo: bool | None = None,
+    optimize: bool | None = None,
+    custom_tex_macros: dict[str, str] | PreparedMacros | None = None,
+) -> str:
+    """Convert a single LaTeX/TeX string to Typst format, skipping type dispatch."""
+    ...
+
+def tex2typst_many(
+    tex: list[str],
+    *,
+    non_strict: bool | None = None,
+    prefer_shorthands: bool | None = None,
+    keep_spaces: bool | None = None,
+    frac_to_slash: bool | None = None,
+    infty_to_oo: bool | None = None,
+    optimize: bool | None = None,
+    custom_tex_macros: dict[str, str] | PreparedMacros | None = None,
+) -> list[str]:
+    """Convert multiple LaTeX/TeX strings to Typst format, skipping type dispatch."""
+    ...
+
 @overload
 def typst2tex(typst: str, *, block_math_mode: bool | None = None) -> str:
     """
@@ -98,6 +140,20 @@ def typst2tex(typst: list[str], *, block_math_mode: bool | None = None) -> list[
     """Convert multiple Typst strings to LaTeX/TeX format (with caching)."""
     ...
 
+def typst2tex_one(typst: str, *, block_math_mode: bool | None = None) -> str:
+    """Convert a single Typst string to LaTeX/TeX format, skipping type dispatch."""
+    ...
+
+def typst2tex_many(
+    typst: list[str], *, block_math_mode: bool | None = None
+) -> list[str]:
+    """Convert multiple Typst strings to LaTeX/TeX format, skipping type dispatch."""
+    ...
+
+def prepare_macros(macros: dict[str, str]) -> PreparedMacros:
+    """Convert custom TeX macros to the canonical form used for caching."""
+    ...
+
 def clear_cache() -> None:
     """Clear all cached conversion results."""
     ...